@@ -1,57 +1,183 @@
+import functools
+import threading
+
 import numpy as np
 import sounddevice as sd
-from scipy.signal import firwin, lfilter
-from scipy.fft import fft, fftfreq
+from scipy.signal import firwin, lfilter, oaconvolve
+from scipy.fft import rfft, rfftfreq, next_fast_len
 import tkinter as tk
 from tkinter import ttk, messagebox
 import serial
-import pandas as pd
 from datetime import datetime
 
 # Matplotlib Imports for Plotting in Tkinter
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
+# Numba is optional: when available, hot loops below get JIT-compiled,
+# otherwise the pure-NumPy fallbacks are used.
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# numexpr is optional too: it fuses elementwise expressions into one
+# chunked, multithreaded pass
+try:
+    import numexpr as ne
+except ImportError:
+    ne = None
+
+# rocket-fft (optional, needs Numba) registers numpy.fft overloads with
+# Numba so FFT work can run inside nopython kernels
+try:
+    import rocket_fft  # noqa: F401 -- importing registers the overloads
+    _have_rocket_fft = numba is not None
+except ImportError:
+    _have_rocket_fft = False
+
 # Global Constants
 fs = 44100  # sampling rate
 
+# Shared PCG64 generator — much faster at Gaussian draws than the legacy
+# global RandomState and supports dtype-aware sampling
+_rng = np.random.default_rng()
+
 # ==========================================================
 # 	SIGNAL GENERATORS
 # ==========================================================
 
 def sine_wave(duration, freq, amp=0.5):
     """Generates a pure sine wave."""
-    t = np.linspace(0, duration, int(fs * duration), False)
-    return amp * np.sin(2 * np.pi * freq * t)
+    n = int(fs * duration)
+    # Phase increment per sample instead of a linspace time axis
+    k = 2 * np.pi * freq / fs
+    out = np.arange(n, dtype=np.float32)
+    if ne is not None:
+        # numexpr evaluates sin chunked and multithreaded, dispatching to
+        # Intel VML's vectorised sin when linked against it; float32
+        # scalars keep the whole expression in single precision
+        return ne.evaluate("amp * sin(k * t)",
+                           local_dict={'amp': np.float32(amp),
+                                       'k': np.float32(k),
+                                       't': out})
+    # In-place fallback: the sample index array is the only allocation
+    out *= k
+    np.sin(out, out=out)
+    out *= amp
+    return out
 
 def white_noise(duration, amp=0.3):
     """Generates White Gaussian Noise (flat power spectrum)."""
     N = int(fs * duration)
-    return amp * np.random.randn(N)
+    return amp * _rng.standard_normal(N, dtype=np.float32)
+
+def _voss_numpy(N, rows):
+    """Voss-McCartney pink noise, vectorised: row k holds one random value
+    for 2**k consecutive samples; summing the rows gives ~1/f density."""
+    pink = np.zeros(N, dtype=np.float32)
+    for k in range(rows):
+        stride = 1 << k
+        reps = -(-N // stride)  # ceil(N / stride)
+        pink += np.repeat(_rng.standard_normal(reps, dtype=np.float32),
+                          stride)[:N]
+    return pink
+
+def _voss_jit(N, rows):
+    """Same Voss-McCartney algorithm sample-by-sample with a running sum;
+    only the row whose bit toggles gets refreshed each sample."""
+    out = np.empty(N, dtype=np.float32)
+    values = np.random.randn(rows)
+    total = values.sum()
+    for i in range(N):
+        n = i + 1
+        k = 0
+        while n & 1 == 0 and k < rows - 1:
+            n >>= 1
+            k += 1
+        total -= values[k]
+        values[k] = np.random.randn()
+        total += values[k]
+        out[i] = total
+    return out
+
+if numba is not None:
+    _voss = numba.njit(cache=True)(_voss_jit)
+else:
+    _voss = _voss_numpy
 
 def pink_noise(duration, amp=0.3):
     """Generates Pink Noise (power spectral density proportional to 1/f)."""
     N = int(fs * duration)
-    # A simple, relatively efficient approximation of pink noise
-    rows = 16
-    array = np.random.randn(rows, N)
-    # Cumulative sum creates the 1/f characteristic (integrated white noise)
-    pink = np.sum(np.cumsum(array, axis=1), axis=0)
+    # Voss-McCartney: 16 octave rows updated at power-of-two strides,
+    # no (rows x N) intermediate matrix like the old cumsum approach
+    pink = _voss(N, 16)
     pink = pink / np.max(np.abs(pink))
     return amp * pink
 
+@functools.lru_cache(maxsize=32)
+def _design_bandpass(low, high, numtaps=1023):
+    """Designs (and caches) a windowed-sinc FIR bandpass for the given band.
+
+    Odd length so the symmetric (zero-phase) taps centre correctly with
+    mode='same'. Re-clicking PLAY with the same band skips the design."""
+    return firwin(numtaps, [low, high], pass_zero=False, fs=fs).astype(np.float32)
+
+def _fft_bandpass_jit(noise, b):
+    """FIR convolution via rfft/irfft, equivalent to mode='same'; with
+    rocket-fft the whole chain runs inside one nopython kernel."""
+    N = noise.size
+    T = b.size
+    M = N + T - 1
+    spec = np.fft.rfft(noise, M) * np.fft.rfft(b, M)
+    full = np.fft.irfft(spec, M)
+    start = (T - 1) // 2
+    # rocket-fft keeps NumPy's fft semantics and upcasts to float64, so
+    # cast back to preserve the float32 pipeline
+    return full[start:start + N].astype(np.float32)
+
+if _have_rocket_fft:
+    _fft_bandpass = numba.njit(cache=True)(_fft_bandpass_jit)
+
 def band_limited_noise(duration, low, high, amp=0.3):
     """Generates band-limited white noise using an FIR filter."""
     N = int(fs * duration)
-    noise = np.random.randn(N)
-
-    # Use a 1024-tap FIR bandpass filter
-    b = firwin(1024, [low, high], pass_zero=False, fs=fs)
-    band = lfilter(b, 1, noise)
+    noise = _rng.standard_normal(N, dtype=np.float32)
+
+    # Round the band edges to whole Hz so near-identical requests hit the
+    # coefficient cache; overlap-add convolution beats lfilter's per-sample
+    # recurrence by a wide margin at this tap count
+    b = _design_bandpass(round(low), round(high))
+    if _have_rocket_fft:
+        band = _fft_bandpass(noise, b)
+    else:
+        band = oaconvolve(noise, b, mode='same')
     band = band / np.max(np.abs(band))
 
     return amp * band
 
+def _fir_block_jit(b, x, zi, out):
+    """Streaming FIR (direct-form transposed): filters one block of x
+    into out, carrying the filter state in zi (length len(b) - 1) between
+    blocks. Meant for block-wise filtering of live input, where lfilter's
+    per-call overhead adds up."""
+    T = b.size
+    for n in range(x.size):
+        acc = b[0] * x[n] + zi[0]
+        for k in range(1, T - 1):
+            zi[k - 1] = zi[k] + b[k] * x[n]
+        zi[T - 2] = b[T - 1] * x[n]
+        out[n] = acc
+    return out
+
+if numba is not None:
+    _fir_block = numba.njit(cache=True, fastmath=True)(_fir_block_jit)
+else:
+    def _fir_block(b, x, zi, out):
+        out[:], zf = lfilter(b, [1.0], x, zi=zi)
+        zi[:] = zf
+        return out
+
 # ==========================================================
 # 	SELECT + CREATE SIGNAL
 # ==========================================================
@@ -59,7 +185,7 @@ def band_limited_noise(duration, low, high, amp=0.3):
 def create_signal(noise_type, duration, freq):
     """Factory function to create the requested signal."""
     if noise_type == "None":
-        return np.zeros(int(fs * duration))
+        return np.zeros(int(fs * duration), dtype=np.float32)
     elif noise_type == "Pure Sine Wave":
         return sine_wave(duration, freq)
     elif noise_type == "White Gaussian Noise":
@@ -72,15 +198,57 @@ def create_signal(noise_type, duration, freq):
         high = freq + 1000
         return band_limited_noise(duration, low, high)
     
-    return np.zeros(int(fs * duration))
+    return np.zeros(int(fs * duration), dtype=np.float32)
 
 # ==========================================================
 # 	SIGNAL ANALYSIS & PLOTTING
 # ==========================================================
 
-def analyze_signal(signal, signal_type, freq):
-    """Calculates key statistical and spectral metrics."""
-    if np.sum(np.abs(signal)) == 0:
+def _stats_jit(x):
+    """Sum, sum-of-squares and abs-max of x in one streaming pass."""
+    s = 0.0
+    ss = 0.0
+    m = 0.0
+    for i in range(x.shape[0]):
+        v = x[i]
+        s += v
+        ss += v * v
+        a = abs(v)
+        if a > m:
+            m = a
+    return s, ss, m
+
+def _stats_numpy(x):
+    """NumPy fallback: x.dot(x) avoids materialising x**2."""
+    return float(x.sum()), float(x.dot(x)), float(np.abs(x).max())
+
+if numba is not None:
+    _stats = numba.njit(cache=True, fastmath=True)(_stats_jit)
+else:
+    _stats = _stats_numpy
+
+@functools.lru_cache(maxsize=8)
+def _rfft_freqs(M):
+    """Caches the rfft frequency axis for a padded length M — the length
+    only changes when the duration does, so clicks at the same duration
+    skip the allocation. Returned read-only to protect the cache."""
+    freqs = rfftfreq(M, 1 / fs).astype(np.float32)
+    freqs.setflags(write=False)
+    return freqs
+
+def analyze_signal(signal, signal_type, freq, spectrum=None):
+    """Calculates key statistical and spectral metrics.
+
+    `spectrum` may carry a precomputed rfft of the signal taken at
+    next_fast_len(len(signal), real=True) points — e.g. one row of a
+    batched multi-channel transform — to skip the FFT here."""
+    N = len(signal)
+
+    # Mean, RMS and abs-max all come from one pass over the signal instead
+    # of separate sum/mean/max reductions (each of which is memory-bound)
+    sig_sum, sig_sumsq, sig_max = _stats(signal)
+
+    if sig_max == 0:
         return {
             'Mean': 0.0,
             'RMS': 0.0,
@@ -89,11 +257,11 @@ def analyze_signal(signal, signal_type, freq):
         }
 
     # 1. Mean
-    mean_val = np.mean(signal)
-    
+    mean_val = sig_sum / N
+
     # 2. RMS (Root Mean Square) - Total signal power
-    rms_val = np.sqrt(np.mean(signal**2))
-    
+    rms_val = np.sqrt(sig_sumsq / N)
+
     # 3. Noise RMS (A simplified approach for generated signals)
     if signal_type == "Pure Sine Wave":
         # Assume negligible noise for a generated pure sine wave
@@ -114,17 +282,32 @@ def analyze_signal(signal, signal_type, freq):
         snr_db = 'N/A' 
         
     # 5. FFT (Frequency-Domain)
-    N = len(signal)
-    yf = fft(signal)
-    xf = fftfreq(N, 1 / fs)
-    
-    # Take the magnitude of the positive frequencies
-    positive_freqs_mask = xf > 0
-    xf_pos = xf[positive_freqs_mask]
-    yf_pos = 2.0/N * np.abs(yf[positive_freqs_mask]) # Scaling for single-sided spectrum
-    
-    # Convert to dB magnitude (for better observation of noise floor)
-    mag_db = 20 * np.log10(yf_pos + 1e-10) # Add epsilon to avoid log(0)
+    # rfft only computes the non-negative half of the spectrum, which is all
+    # a real signal has anyway — half the work of the full complex fft.
+    # Zero-pad to the next 2/3/5-smooth length so pocketfft stays on its
+    # fast radix kernels (awkward durations can give N with large prime factors)
+    M = next_fast_len(N, real=True)
+    yf = spectrum if spectrum is not None else rfft(signal, n=M)
+
+    # Drop the DC bin (index 0) to keep only the positive frequencies
+    xf_pos = _rfft_freqs(M)[1:]
+
+    # Single-sided magnitude in dB (2/N scaling, epsilon avoids log(0)).
+    # The modulus is taken first in NumPy: with abs() inside the numexpr
+    # expression the whole evaluation stays in the complex domain and
+    # mag_db comes back complex. Both branches return float32.
+    mag_db = np.abs(yf[1:]).astype(np.float32, copy=False)
+    if ne is not None:
+        # One fused pass for the scale/epsilon/log chain
+        mag_db = ne.evaluate("20.0 * log10((2.0 / N) * mag + 1e-10)",
+                             local_dict={'mag': mag_db, 'N': N})
+        mag_db = mag_db.astype(np.float32, copy=False)
+    else:
+        # Reuse the magnitude buffer for every subsequent step
+        mag_db *= 2.0 / N
+        mag_db += 1e-10
+        np.log10(mag_db, out=mag_db)
+        mag_db *= 20.0
 
     return {
         'Mean': mean_val,
@@ -136,83 +319,176 @@ def analyze_signal(signal, signal_type, freq):
     }
 
 def plot_signal(signal, analysis_results, fig, axes, title):
-    """Plots the time-domain waveform and the frequency spectrum."""
-    t = np.linspace(0, len(signal)/fs, len(signal), endpoint=False)
-    
-    # Clear previous plots
-    for ax in axes:
-        ax.clear()
+    """Updates the waveform and spectrum lines in place.
+
+    The Line2D objects are created once at GUI construction; updating
+    their data avoids tearing down and rebuilding axes, ticks and grid
+    on every click."""
+    # Only the first 20 ms is shown (fixed xlim), so don't hand matplotlib
+    # the other ~99% of the samples just to clip them off-screen
+    visible = min(int(0.02 * fs), len(signal))
+    t = np.arange(visible, dtype=np.float32) / fs
 
     # --- Plot 1: Time Domain ---
-    axes[0].plot(t, signal, color='#3498db')
+    line_time.set_data(t, signal[:visible])
     axes[0].set_title(f'Time Domain Waveform: {title}', fontsize=10)
-    axes[0].set_xlabel('Time (s)', fontsize=8)
-    axes[0].set_ylabel('Amplitude', fontsize=8)
-    axes[0].grid(True, linestyle='--', alpha=0.6)
-    axes[0].tick_params(axis='both', which='major', labelsize=7)
-    axes[0].set_xlim(0, 0.02) # Zoom into the first 20ms for visibility
+    axes[0].relim()
+    axes[0].autoscale_view(scalex=False)  # keep the 20 ms window
 
     # --- Plot 2: Frequency Domain (FFT) ---
-    axes[1].plot(analysis_results['xf_pos'], analysis_results['mag_db'], color='#e74c3c', linewidth=1)
+    # Decimate 4x for rendering, but peak-preservingly: a plain stride
+    # can drop the single bin a pure tone lives in. Keep each group of
+    # four's loudest bin, plotted at that bin's own frequency.
+    xf_pos = analysis_results['xf_pos']
+    mag_db = analysis_results['mag_db']
+    groups = len(mag_db) // 4
+    if groups:
+        idx = np.argmax(mag_db[:groups * 4].reshape(groups, 4), axis=1)
+        idx += np.arange(groups) * 4
+        line_fft.set_data(xf_pos[idx], mag_db[idx])
+    else:
+        line_fft.set_data(xf_pos, mag_db)
     axes[1].set_title(f'Frequency Spectrum (FFT): {title}', fontsize=10)
-    axes[1].set_xlabel('Frequency (Hz)', fontsize=8)
-    axes[1].set_ylabel('Magnitude (dB)', fontsize=8)
-    axes[1].grid(True, linestyle='--', alpha=0.6)
-    axes[1].tick_params(axis='both', which='major', labelsize=7)
-    axes[1].set_xlim(0, fs/2)
-    axes[1].set_ylim(-120, 0) # Set a consistent dB range
-
-    fig.tight_layout()
-    canvas.draw()
-    
+
+    canvas.draw_idle()
+
+# ==========================================================
+# 	STREAMED PLAYBACK
+# ==========================================================
+
+# One persistent output stream; the callback drains whatever buffer is
+# currently queued in fixed-size blocks, so playback starts immediately
+# and a new PLAY simply swaps the buffer under the lock.
+_stream = None
+_play_lock = threading.Lock()
+_play_buffer = None
+_play_pos = 0
+
+def _playback_callback(outdata, frames, time, status):
+    """Feeds the output stream from the queued signal buffer (runs on the
+    PortAudio thread, hence the lock)."""
+    global _play_buffer, _play_pos
+    out = outdata[:, 0]
+    with _play_lock:
+        buf = _play_buffer
+        if buf is None:
+            out[:] = 0.0
+            return
+        chunk = buf[_play_pos:_play_pos + frames]
+        out[:chunk.size] = chunk
+        out[chunk.size:] = 0.0
+        _play_pos += frames
+        if _play_pos >= buf.size:
+            _play_buffer = None
+
+def _start_playback(signal):
+    """Queues a signal on the persistent output stream, creating the
+    stream on first use. Runs entirely under the lock: PLAY clicks come
+    from worker threads, and two racing first plays must not each create
+    a stream draining the same cursor."""
+    global _stream, _play_buffer, _play_pos
+    with _play_lock:
+        _play_buffer = signal
+        _play_pos = 0
+        if _stream is None:
+            _stream = sd.OutputStream(samplerate=fs, channels=1,
+                                      dtype='float32', blocksize=2048,
+                                      callback=_playback_callback)
+            _stream.start()
+
 # ==========================================================
 # 	PLAY TWO SIGNALS TOGETHER (WITH ANALYSIS)
 # ==========================================================
 
+def _mix_and_max_jit(a, b, out):
+    """Writes a + b into out and returns the abs-max in the same pass."""
+    m = 0.0
+    for i in range(a.size):
+        v = a[i] + b[i]
+        out[i] = v
+        av = abs(v)
+        if av > m:
+            m = av
+    return m
+
+def _mix_and_max_numpy(a, b, out):
+    """NumPy fallback: in-place add, then a separate peak reduction."""
+    np.add(a, b, out=out)
+    return float(np.abs(out).max())
+
+if numba is not None:
+    _mix_and_max = numba.njit(cache=True, fastmath=True)(_mix_and_max_jit)
+else:
+    _mix_and_max = _mix_and_max_numpy
+
 def play_both():
-    """Generates both signals, analyzes the first one, plots, and plays the mix."""
+    """Reads the inputs on the Tk thread, then hands generation, analysis
+    and playback to a worker so the mainloop stays responsive."""
     try:
         duration = float(entry_duration.get())
         freq1 = float(entry_freq1.get())
         freq2 = float(entry_freq2.get())
-        type1 = combo_noise1.get()
-        type2 = combo_noise2.get()
+    except ValueError:
+        messagebox.showerror("Input Error", "Please ensure all frequency and duration fields contain valid numbers.")
+        return
+    type1 = combo_noise1.get()
+    type2 = combo_noise2.get()
 
+    threading.Thread(target=_play_both_impl,
+                     args=(duration, freq1, freq2, type1, type2),
+                     daemon=True).start()
+
+def _play_both_impl(duration, freq1, freq2, type1, type2):
+    """Generates both signals, analyzes the first one, and plays the mix.
+
+    Runs on a worker thread; widget updates are marshalled back to the
+    Tk thread with root.after since Tkinter is not thread-safe."""
+    try:
         # 1. Generate Signals
         s1 = create_signal(type1, duration, freq1)
         s2 = create_signal(type2, duration, freq2)
 
-        # 2. Analyze Signal 1 (The primary one for plotting)
-        analysis1 = analyze_signal(s1, type1, freq1)
-        
-        # 3. Update Analysis Display for Signal 1
-        update_analysis_display(analysis1, type1, freq1)
-
-        # 4. Plot Signal 1
-        if np.sum(np.abs(s1)) > 0:
-            plot_signal(s1, analysis1, fig, axes, f"{type1} ({freq1} Hz)")
+        # 2. Analyze Signal 1 (The primary one for plotting). Both channels
+        # go through one batched rfft so pocketfft plans the pair once;
+        # row 1 is ready for the day Signal 2 gets analysed/stereo output.
+        if len(s1):
+            M = next_fast_len(len(s1), real=True)
+            Y = rfft(np.stack((s1, s2)), n=M, axis=-1)
+            analysis1 = analyze_signal(s1, type1, freq1, spectrum=Y[0])
         else:
-            # Clear plots if no signal is selected
-            for ax in axes:
-                ax.clear()
-            fig.canvas.draw()
-
+            # Zero-length input (e.g. duration 0): rfft would reject n=0,
+            # so skip the batch and let the silence gate return early
+            analysis1 = analyze_signal(s1, type1, freq1)
+
+        # 3./4. Update the metrics display and the plots on the Tk thread
+        def _update_ui():
+            update_analysis_display(analysis1, type1, freq1)
+            # analyze_signal only returns plot data for a non-silent signal
+            if 'xf_pos' in analysis1:
+                plot_signal(s1, analysis1, fig, axes, f"{type1} ({freq1} Hz)")
+            else:
+                # Blank the lines if no signal is selected, keeping the axes
+                line_time.set_data([], [])
+                line_fft.set_data([], [])
+                canvas.draw_idle()
+
+        root.after(0, _update_ui)
+
+        # 5. Mix and Play — one fused pass produces the mix and its peak,
+        # instead of an add, an abs temp and a max reduction
+        final_signal = np.empty_like(s1)
+        max_amp = _mix_and_max(s1, s2, final_signal)
 
-        # 5. Mix and Play
-        final_signal = s1 + s2
-        
-        sd.stop()
         # Scale the signal to prevent clipping after mixing
-        max_amp = np.max(np.abs(final_signal))
         if max_amp > 1.0:
             final_signal /= max_amp
-            
-        sd.play(final_signal, fs)
-        
-    except ValueError:
-        messagebox.showerror("Input Error", "Please ensure all frequency and duration fields contain valid numbers.")
+
+        _start_playback(final_signal)
+
     except Exception as e:
-        messagebox.showerror("Error", f"An error occurred during playback/analysis: {str(e)}")
+        err = str(e)
+        root.after(0, lambda: messagebox.showerror(
+            "Error", f"An error occurred during playback/analysis: {err}"))
 
 
 def update_analysis_display(results, sig_type, freq):
@@ -231,17 +507,25 @@ def update_analysis_display(results, sig_type, freq):
     label_snr.config(text=f"SNR (dB): {snr_text}")
 
 def stop_sound():
-    """Stops any currently playing audio."""
-    sd.stop()
+    """Stops any currently playing audio by dropping the queued buffer."""
+    global _play_buffer
+    with _play_lock:
+        _play_buffer = None
 
 # ==========================================================
 # 	READ FROM ARDUINO (5 SECONDS)
 # ==========================================================
 
 def record_from_arduino():
+    """Kicks the serial capture onto a worker thread — the capture blocks
+    for the whole recording, which would freeze the mainloop."""
+    port = entry_port.get()
+    threading.Thread(target=_record_from_arduino_impl, args=(port,),
+                     daemon=True).start()
+
+def _record_from_arduino_impl(port):
     """Records serial data from Arduino and saves it to a CSV file."""
     try:
-        port = entry_port.get()
         baud = 115200
 
         ser = serial.Serial(port, baud, timeout=1)
@@ -253,29 +537,43 @@ def record_from_arduino():
             if line == "START":
                 break
 
-        samples = []
-        
-        # read until END signal
-        while True:
-            line = ser.readline().decode().strip()
-            if line == "END":
-                break
-
-            if line.isdigit():
-                samples.append(int(line))
+        # Bulk-read the payload and parse it in C instead of a readline/
+        # decode/int loop per sample. read_until honours the 1 s port
+        # timeout as a deadline per call, so keep reading until END has
+        # actually arrived — the capture spans several seconds.
+        raw = bytearray()
+        while b"END" not in raw:
+            chunk = ser.read_until(b"END")
+            if not chunk:
+                raise TimeoutError("Serial capture ended without END marker")
+            raw += chunk
+        blob = bytes(raw[:raw.index(b"END")])
+        try:
+            samples = np.fromstring(blob, dtype=np.int32, sep="\n")
+        except ValueError:
+            # A glitched line makes NumPy's text parser raise; drop the
+            # bad lines and keep the rest of the capture
+            clean = b"\n".join(l for l in blob.splitlines()
+                               if l.strip().isdigit())
+            samples = np.fromstring(clean, dtype=np.int32, sep="\n")
 
         ser.close()
 
         # Save CSV
         filename = "capture_" + datetime.now().strftime("%Y%m%d_%H%M%S") + ".csv"
-        pd.DataFrame(samples, columns=["ADC Value"]).to_csv(filename, index=False)
+        np.savetxt(filename, samples, fmt="%d", header="ADC Value", comments="")
 
-        messagebox.showinfo("Saved", f"Data capture saved as: {filename}")
+        root.after(0, lambda: messagebox.showinfo(
+            "Saved", f"Data capture saved as: {filename}"))
 
     except serial.SerialException as e:
-        messagebox.showerror("Serial Error", f"Could not connect or read from COM port {port}. Please check the port and baud rate.\nDetails: {str(e)}")
+        err = str(e)
+        root.after(0, lambda: messagebox.showerror(
+            "Serial Error", f"Could not connect or read from COM port {port}. Please check the port and baud rate.\nDetails: {err}"))
     except Exception as e:
-        messagebox.showerror("Error", f"An unexpected error occurred during recording: {str(e)}")
+        err = str(e)
+        root.after(0, lambda: messagebox.showerror(
+            "Error", f"An unexpected error occurred during recording: {err}"))
 
 
 # ==========================================================
@@ -383,14 +681,28 @@ fig, axes = plt.subplots(nrows=2, ncols=1, figsize=(6, 6))
 plt.subplots_adjust(hspace=0.4)
 fig.set_facecolor('#f0f0f0') # Match Tkinter background
 
-# Initial plot display setup
+# Static axes styling is applied once here; plot_signal only swaps the
+# line data and titles afterwards
 for ax in axes:
     ax.set_title("Ready for Analysis", fontsize=10)
-    ax.set_xlabel('Time/Frequency', fontsize=8)
-    ax.set_ylabel('Amplitude/dB', fontsize=8)
     ax.tick_params(axis='both', which='major', labelsize=7)
     ax.grid(True, linestyle='--', alpha=0.6)
 
+axes[0].set_xlabel('Time (s)', fontsize=8)
+axes[0].set_ylabel('Amplitude', fontsize=8)
+axes[0].set_xlim(0, 0.02)  # Zoom into the first 20ms for visibility
+
+axes[1].set_xlabel('Frequency (Hz)', fontsize=8)
+axes[1].set_ylabel('Magnitude (dB)', fontsize=8)
+axes[1].set_xlim(0, fs/2)
+axes[1].set_ylim(-120, 0)  # Set a consistent dB range
+
+# The persistent lines that plot_signal updates in place
+line_time, = axes[0].plot([], [], color='#3498db')
+line_fft, = axes[1].plot([], [], color='#e74c3c', linewidth=1)
+
+fig.tight_layout()
+
 canvas = FigureCanvasTkAgg(fig, master=plot_analysis_frame)
 canvas_widget = canvas.get_tk_widget()
 canvas_widget.pack(fill=tk.BOTH, expand=1, pady=10)
@@ -1,44 +1,100 @@
+import functools
+
 import numpy as np
 import sounddevice as sd
-from scipy.signal import firwin, lfilter
+from scipy.signal import firwin, oaconvolve
 import tkinter as tk
 from tkinter import ttk, messagebox
 import serial
-import pandas as pd
 from datetime import datetime
 
+# Numba is optional: hot loops get JIT-compiled when it is installed
+try:
+    import numba
+except ImportError:
+    numba = None
+
 fs = 44100  # sampling rate
 
+# shared PCG64 generator — faster than the legacy global RandomState
+_rng = np.random.default_rng()
+
 
 # ==========================================================
 #                SIGNAL GENERATORS
 # ==========================================================
 
 def sine_wave(duration, freq, amp=0.5):
-    t = np.linspace(0, duration, int(fs * duration), False)
-    return amp * np.sin(2 * np.pi * freq * t)
+    n = int(fs * duration)
+    # phase per sample in-place: the index array is the only allocation
+    k = 2 * np.pi * freq / fs
+    out = np.arange(n, dtype=np.float32)
+    out *= k
+    np.sin(out, out=out)
+    out *= amp
+    return out
 
 
 def white_noise(duration, amp=0.3):
     N = int(fs * duration)
-    return amp * np.random.randn(N)
+    return amp * _rng.standard_normal(N, dtype=np.float32)
+
+
+# Voss-McCartney pink noise: row k holds one random value for 2**k
+# consecutive samples; summing the rows gives ~1/f power density
+def _voss_numpy(N, rows):
+    pink = np.zeros(N, dtype=np.float32)
+    for k in range(rows):
+        stride = 1 << k
+        reps = -(-N // stride)  # ceil(N / stride)
+        pink += np.repeat(_rng.standard_normal(reps, dtype=np.float32),
+                          stride)[:N]
+    return pink
+
+
+def _voss_jit(N, rows):
+    out = np.empty(N, dtype=np.float32)
+    values = np.random.randn(rows)
+    total = values.sum()
+    for i in range(N):
+        n = i + 1
+        k = 0
+        while n & 1 == 0 and k < rows - 1:
+            n >>= 1
+            k += 1
+        total -= values[k]
+        values[k] = np.random.randn()
+        total += values[k]
+        out[i] = total
+    return out
+
+
+if numba is not None:
+    _voss = numba.njit(cache=True)(_voss_jit)
+else:
+    _voss = _voss_numpy
 
 
 def pink_noise(duration, amp=0.3):
     N = int(fs * duration)
-    rows = 16
-    array = np.random.randn(rows, N)
-    pink = np.sum(np.cumsum(array, axis=1), axis=0)
+    pink = _voss(N, 16)
     pink = pink / np.max(np.abs(pink))
     return amp * pink
 
 
+# cache the windowed-sinc design so repeated plays of the same band
+# skip it; odd tap count keeps the symmetric FIR centred for mode='same'
+@functools.lru_cache(maxsize=32)
+def _design_bandpass(low, high, numtaps=1023):
+    return firwin(numtaps, [low, high], pass_zero=False, fs=fs).astype(np.float32)
+
+
 def band_limited_noise(duration, low, high, amp=0.3):
     N = int(fs * duration)
-    noise = np.random.randn(N)
+    noise = _rng.standard_normal(N, dtype=np.float32)
 
-    b = firwin(1024, [low, high], pass_zero=False, fs=fs)
-    band = lfilter(b, 1, noise)
+    b = _design_bandpass(round(low), round(high))
+    band = oaconvolve(noise, b, mode='same')
     band = band / np.max(np.abs(band))
 
     return amp * band
@@ -50,7 +106,7 @@ def band_limited_noise(duration, low, high, amp=0.3):
 
 def create_signal(noise_type, duration, freq):
     if noise_type == "None":
-        return np.zeros(int(fs * duration))
+        return np.zeros(int(fs * duration), dtype=np.float32)
 
     elif noise_type == "Pure Sine Wave":
         return sine_wave(duration, freq)
@@ -66,7 +122,7 @@ def create_signal(noise_type, duration, freq):
         high = freq + 1000
         return band_limited_noise(duration, low, high)
 
-    return np.zeros(int(fs * duration))
+    return np.zeros(int(fs * duration), dtype=np.float32)
 
 
 # ==========================================================
@@ -111,22 +167,29 @@ def record_from_arduino():
             if line == "START":
                 break
 
-        samples = []
-
-        # read until END
-        while True:
-            line = ser.readline().decode().strip()
-            if line == "END":
-                break
-
-            if line.isdigit():
-                samples.append(int(line))
+        # bulk-read up to END and parse in C instead of line-by-line;
+        # read_until returns at the 1 s port timeout, so loop until the
+        # END marker has actually arrived
+        raw = bytearray()
+        while b"END" not in raw:
+            chunk = ser.read_until(b"END")
+            if not chunk:
+                raise TimeoutError("Serial capture ended without END marker")
+            raw += chunk
+        blob = bytes(raw[:raw.index(b"END")])
+        try:
+            samples = np.fromstring(blob, dtype=np.int32, sep="\n")
+        except ValueError:
+            # drop glitched lines rather than losing the whole capture
+            clean = b"\n".join(l for l in blob.splitlines()
+                               if l.strip().isdigit())
+            samples = np.fromstring(clean, dtype=np.int32, sep="\n")
 
         ser.close()
 
         # Save CSV
         filename = "capture_" + datetime.now().strftime("%H%M%S") + ".csv"
-        pd.DataFrame(samples, columns=["ADC"]).to_csv(filename, index=False)
+        np.savetxt(filename, samples, fmt="%d", header="ADC", comments="")
 
         messagebox.showinfo("Saved", f"Saved as: {filename}")
 